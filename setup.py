@@ -1,11 +1,52 @@
 import setuptools
 import os
+import warnings
 from pathlib import Path
+from setuptools.command.build_ext import build_ext
 
 root = Path(os.path.realpath(__file__)).parent
 version_file = root / "src" / "sphinx_codeautolink" / "VERSION"
 readme_file = root / "readme_pypi.rst"
 
+
+class OptionalBuildExt(build_ext):
+    """Fall back to pure Python if compiling extensions fails."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            warnings.warn(
+                f"Compiling extensions failed, using pure Python: {e}", stacklevel=2
+            )
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            warnings.warn(
+                f"Compiling {ext.name} failed, using pure Python: {e}", stacklevel=2
+            )
+
+
+def compiled_modules() -> list:
+    """Optionally compile the parsing module with Cython."""
+    if not os.environ.get("SPHINX_CODEAUTOLINK_CYTHON"):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        warnings.warn("Cython not installed, using pure Python.", stacklevel=2)
+        return []
+    return cythonize(
+        str(root / "src" / "sphinx_codeautolink" / "parse.py"),
+        language_level=3,
+        build_dir=str(root / "build"),
+        # Keep pure Python semantics of annotations
+        compiler_directives={"annotation_typing": False},
+    )
+
+
 setuptools.setup(
     name="sphinx-codeautolink",
     version=version_file.read_text().strip(),
@@ -31,6 +72,8 @@ setuptools.setup(
     packages=setuptools.find_packages(where="src"),
     package_dir={"": "src"},
     include_package_data=True,
+    ext_modules=compiled_modules(),
+    cmdclass={"build_ext": OptionalBuildExt},
 
     python_requires=">=3.6",
     install_requires=[
@@ -5,15 +5,21 @@ import builtins
 
 from contextlib import contextmanager
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import import_module
-from typing import Dict, Union, List, Optional, Tuple
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    Callable, Dict, Iterable, Mapping, NamedTuple, Union, List, Optional, Tuple
+)
 from dataclasses import dataclass, field
 
 from .warn import logger, warn_type
 
 HAS_WALRUS = (sys.version_info >= (3, 8))
 HAS_MATCH = (sys.version_info >= (3, 10))
+# Slotted dataclasses to reduce memory and attribute access cost where available
+SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 def parse_names(source: str, doctree_node) -> List['Name']:
@@ -24,13 +30,25 @@ def parse_names(source: str, doctree_node) -> List['Name']:
     return visitor.accessed
 
 
+@lru_cache(maxsize=256)
+def _star_import_names(module: str) -> Optional[Tuple[str, ...]]:
+    """Determine names imported from a module with a star, None if not found."""
+    try:
+        mod = import_module(module)
+    except ImportError:
+        return None
+    names = getattr(mod, '__all__', None)
+    if names is None:
+        names = [name for name in mod.__dict__ if not name.startswith('_')]
+    return tuple(names)
+
+
 def linenos(node: ast.AST) -> Tuple[int, int]:
     """Return lineno and end_lineno safely."""
     return node.lineno, getattr(node, 'end_lineno', node.lineno)
 
 
-@dataclass
-class Component:
+class Component(NamedTuple):
     """Name access component."""
 
     name: str
@@ -41,33 +59,38 @@ class Component:
     @classmethod
     def from_ast(cls, node):
         """Generate a Component from an AST node."""
-        context = 'load'
-        if isinstance(node, ast.Name):
-            name = node.id
-            context = node.ctx.__class__.__name__.lower()
-        elif isinstance(node, ast.Attribute):
-            name = node.attr
-            context = node.ctx.__class__.__name__.lower()
-        elif isinstance(node, ast.arg):
-            name = node.arg
-        elif isinstance(node, ast.Call):
-            name = NameBreak.call
-        elif HAS_MATCH and isinstance(node, ast.MatchAs):
-            name = node.name
-            context = 'store'
-        else:
-            raise ValueError(f'Invalid AST for component: {node.__class__.__name__}')
-        return cls(name, *linenos(node), context)
+        try:
+            factory = component_factories[type(node)]
+        except KeyError:
+            msg = f'Invalid AST for component: {node.__class__.__name__}'
+            raise ValueError(msg) from None
+        return factory(node)
+
+
+# Names of ast.Load / Store / Del, as in Component.context
+ctx_names = {ast.Load: 'load', ast.Store: 'store', ast.Del: 'del'}
+component_factories: Dict[type, Callable[[ast.AST], Component]] = {
+    ast.Name: lambda n: Component(n.id, *linenos(n), ctx_names[type(n.ctx)]),
+    ast.Attribute: lambda n: Component(
+        n.attr, *linenos(n), ctx_names[type(n.ctx)]
+    ),
+    ast.arg: lambda n: Component(n.arg, *linenos(n), 'load'),
+    ast.Call: lambda n: Component(NameBreak.call, *linenos(n), 'load'),
+}
+if HAS_MATCH:
+    component_factories[ast.MatchAs] = lambda n: Component(
+        n.name, *linenos(n), 'store'
+    )
 
 
-@dataclass
+@dataclass(**SLOTS)
 class PendingAccess:
     """Pending name access."""
 
     components: List[Component]
 
 
-@dataclass
+@dataclass(**SLOTS)
 class AssignTarget:
     """
     Assign target.
@@ -81,7 +104,7 @@ class AssignTarget:
     elements: List[Optional[PendingAccess]]
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Assignment:
     """
     Representation of an assignment statement.
@@ -101,6 +124,9 @@ class NameBreak(str, Enum):
     call = '()'
 
 
+name_breaks = frozenset(NameBreak)
+
+
 class LinkContext(str, Enum):
     """Context in which a link appears."""
 
@@ -110,7 +136,7 @@ class LinkContext(str, Enum):
     import_target = 'import_target'  # from mod.sub import *foo*
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Name:
     """A name accessed in the source traced back to an import."""
 
@@ -122,7 +148,7 @@ class Name:
     resolved_location: Optional[str] = None
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Access:
     """
     Accessed import, to be broken down into suitable chunks.
@@ -138,28 +164,29 @@ class Access:
     """
 
     context: LinkContext
-    prior_components: List[Component]
+    prior_components: Tuple[Component, ...]
     components: List[Component]
     hidden_components: List[Component] = field(default_factory=list)
 
     @property
-    def full_components(self):
+    def full_components(self) -> Tuple[Component, ...]:
         """All components from import base to used components."""
         if not self.prior_components:
             # Import statement itself
-            return self.hidden_components + self.components
+            return tuple(self.hidden_components + self.components)
 
         if self.hidden_components:
             proper_components = self.hidden_components[1:] + self.components
         else:
             proper_components = self.components[1:]
-        return self.prior_components + proper_components
+        return self.prior_components + tuple(proper_components)
 
     @property
     def code_str(self):
         """Code representation of components."""
-        break_on = set(NameBreak)
-        breaks = [i for i, c in enumerate(self.components) if c.name in break_on]
+        breaks = [
+            i for i, c in enumerate(self.components) if c.name in name_breaks
+        ]
         start_ix = breaks[-1] + 1 if breaks else 0
         return '.'.join(c.name for c in self.components[start_ix:])
 
@@ -182,29 +209,24 @@ class Access:
 
     def split(self) -> List[Name]:
         """Split access into multiple names."""
-        # Copy to avoid modifying the instance in place
+        components = self.components
+        cuts = [
+            i for i, c in enumerate(components) if i and c.name == NameBreak.call
+        ]
+        ends = cuts + [len(components)]
         items = [Access(
-            context=self.context,
-            prior_components=self.prior_components[:],
-            components=self.components[:],
-            hidden_components=self.hidden_components[:],
+            self.context,
+            self.prior_components,
+            components[:ends[0]],
+            hidden_components=self.hidden_components,
         )]
-        while True:
-            current = items[-1]
-            for i, comp in enumerate(current.components):
-                if i and comp.name == NameBreak.call:
-                    hidden = current.hidden_components + current.components[:i]
-                    next_ = Access(
-                        LinkContext.after_call,
-                        current.prior_components,
-                        current.components[i:],
-                        hidden_components=hidden,
-                    )
-                    current.components = current.components[:i]
-                    items.append(next_)
-                    break
-            else:
-                break
+        for start, end in zip(cuts, ends[1:]):
+            items.append(Access(
+                LinkContext.after_call,
+                self.prior_components,
+                components[start:end],
+                hidden_components=self.hidden_components + components[:start],
+            ))
         if items[-1].components[-1].name == NameBreak.call:
             items.pop()
         return [self.to_name(i) for i in items]
@@ -214,12 +236,20 @@ def track_parents(func):
     """
     Track a stack of nodes to determine the position of the current node.
 
-    Uses and increments the surrounding classes :attr:`_parents`.
+    Marks a visitor method to use and increment the surrounding classes
+    :attr:`_parents`. The tracking is applied in the dispatch table,
+    so marked methods should only be called via :meth:`visit`.
     """
+    func.tracks_parents = True
+    return func
+
+
+def with_tracked_parents(func):
+    """Increment parents and dispatch the result of the outermost node."""
     @wraps(func)
-    def wrapper(self: 'ImportTrackerVisitor', *args, **kwargs):
+    def wrapper(self: 'ImportTrackerVisitor', node: ast.AST):
         self._parents += 1
-        result = func(self, *args, **kwargs)
+        result = func(self, node)
         self._parents -= 1
         if not self._parents:
             self.dispatch_result(result)
@@ -227,15 +257,54 @@ def track_parents(func):
     return wrapper
 
 
-builtin_components: Dict[str, List[Component]] = {
-    b: [Component(b, -1, -1, LinkContext.none)] for b in dir(builtins)
-}
+def with_reset_parents(func):
+    """Reset parents state for the duration of a visit."""
+    @wraps(func)
+    def wrapper(self: 'ImportTrackerVisitor', node: ast.AST):
+        self._parents, old = (0, self._parents)
+        result = func(self, node)
+        self._parents = old
+        return result
+    return wrapper
+
+
+def with_reset_tracked_parents(func):
+    """Reset parents state and track the node as the outermost one."""
+    @wraps(func)
+    def wrapper(self: 'ImportTrackerVisitor', node: ast.AST):
+        self._parents, old = (1, self._parents)
+        result = func(self, node)
+        self._parents = old
+        self.dispatch_result(result)
+        return result
+    return wrapper
+
+
+# Nodes that can't contain names, skipped when visiting children
+leaf_nodes = frozenset(
+    [ast.Constant]
+    + [
+        n for n in vars(ast).values()
+        if isinstance(n, type) and issubclass(n, ast.AST) and not n._fields
+    ]
+    + (
+        [ast.Num, ast.Str, ast.Bytes, ast.NameConstant, ast.Ellipsis]
+        if sys.version_info < (3, 8) else []
+    )
+)
+
+builtin_components: Mapping[str, Tuple[Component, ...]] = MappingProxyType({
+    b: (Component(b, -1, -1, LinkContext.none),) for b in dir(builtins)
+})
+
+# Names in scope, with None values shadowing builtins
+Scope = Dict[str, Optional[Tuple[Component, ...]]]
 
 
 class ImportTrackerVisitor(ast.NodeVisitor):
     """Track imports and their use through source code."""
 
-    def __init__(self, doctree_node):
+    def __init__(self, doctree_node, scope: Optional[Scope] = None):
         super().__init__()
         self.accessed: List[Name] = []
         self.in_augassign = False
@@ -246,15 +315,32 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         # Stack for dealing with class body pseudo scopes
         # which are completely bypassed by inner scopes (func, lambda).
         # Current values are copied to the next class body level.
-        self.pseudo_scopes_stack: List[Dict[str, List[Component]]] = [
-            builtin_components.copy()
-        ]
+        # Builtins are shared and looked up when a name is not in a scope.
+        self.pseudo_scopes_stack: List[Scope] = [scope if scope is not None else {}]
         # Stack for dealing with nested scopes.
         # Holds references to the values of previous nesting levels.
-        self.outer_scopes_stack: List[Dict[str, List[Component]]] = []
+        self.outer_scopes_stack: List[Scope] = []
 
     def save_access(self, access: Access) -> None:
         """Convert Access to Names to store in the visitor for aggregation."""
+        components = access.components
+        if (
+            len(components) == 1
+            and access.prior_components
+            and not access.hidden_components
+            and components[0].name not in name_breaks
+        ):
+            # Plain name, equivalent to but faster than splitting
+            component = components[0]
+            self.accessed.append(Name(
+                [c.name for c in access.prior_components],
+                component.name,
+                component.lineno,
+                component.end_lineno,
+                context=access.context,
+            ))
+            return
+
         names = access.split() if not self._no_split else [Access.to_name(access)]
         self.accessed.extend(names)
 
@@ -265,13 +351,6 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         yield
         self._no_split = old
 
-    @contextmanager
-    def reset_parents(self):
-        """Reset parents state for the duration of the context."""
-        self._parents, old = (0, self._parents)
-        yield
-        self._parents = old
-
     # Nodes that are excempt from resetting parents in default visit
     track_nodes = (
         ast.Name,
@@ -283,13 +362,66 @@ class ImportTrackerVisitor(ast.NodeVisitor):
     if HAS_MATCH:
         track_nodes += (ast.MatchAs,)
 
+    # Node type to visitor method, built once per class
+    _dispatch: Dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Build dispatch table of subclasses."""
+        super().__init_subclass__(**kwargs)
+        cls._build_dispatch()
+
+    @classmethod
+    def _build_dispatch(cls) -> None:
+        """Map node types to their visitor methods."""
+        dispatch = {}
+        for name in dir(cls):
+            if not name.startswith('visit_'):
+                continue
+            node_type = getattr(ast, name[len('visit_'):], None)
+            if not isinstance(node_type, type):
+                continue
+            method = getattr(cls, name)
+            if method is getattr(ast.NodeVisitor, name, None):
+                continue  # inherited, e.g. visit_Constant
+            tracked = getattr(method, 'tracks_parents', False)
+            if issubclass(node_type, cls.track_nodes):
+                wrapper = with_tracked_parents if tracked else None
+            else:
+                wrapper = with_reset_tracked_parents if tracked else with_reset_parents
+            dispatch[node_type] = method if wrapper is None else wrapper(method)
+        cls._dispatch = dispatch
+
     def visit(self, node: ast.AST):
         """Override default visit to track name access and assignments."""
-        if isinstance(node, self.track_nodes):
-            return super().visit(node)
+        method = self._dispatch.get(type(node))
+        if method is not None:
+            return method(self, node)
+
+        self._parents, old = (0, self._parents)
+        result = self.generic_visit(node)
+        self._parents = old
+        return result
 
-        with self.reset_parents():
-            return super().visit(node)
+    def generic_visit(self, node: ast.AST):
+        """
+        Visit children of a node without a specific visitor method.
+
+        Parents are already reset, so children without visitor methods
+        are recursed into directly instead of going through :meth:`visit`.
+        """
+        dispatch = self._dispatch
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            children = value if type(value) is list else (value,)
+            for child in children:
+                if not isinstance(child, ast.AST):
+                    continue
+                child_type = type(child)
+                method = dispatch.get(child_type)
+                if method is not None:
+                    method(self, child)
+                elif child_type not in leaf_nodes:
+                    self.generic_visit(child)
 
     def overwrite_name(self, name: str):
         """Overwrite name in current scope."""
@@ -299,19 +431,24 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         # that we could follow, but for now it's not really worth the effort.
         # With a dotted value, the following condition will never hold as long
         # as the dotted components of imports are discarded on creating the import.
-        self.pseudo_scopes_stack[-1].pop(name, None)
+        scope = self.pseudo_scopes_stack[-1]
+        scope.pop(name, None)
+        if name in builtin_components:
+            scope[name] = None
 
-    def assign_name(self, name: str, components: List[Component]):
+    def assign_name(self, name: str, components: Iterable[Component]):
         """Import or assign a name to current scope."""
         # Overwriting technically unnecessary until it properly follows dots
         self.overwrite_name(name)
-        self.pseudo_scopes_stack[-1][name] = components
+        self.pseudo_scopes_stack[-1][name] = tuple(components)
 
     def create_access(
         self, scope_key: str, new_components: List[Component]
     ) -> Optional[Access]:
         """Create access from scope."""
-        prior = self.pseudo_scopes_stack[-1].get(scope_key, None)
+        prior = self.pseudo_scopes_stack[-1].get(
+            scope_key, builtin_components.get(scope_key)
+        )
         if prior is None:
             return
 
@@ -366,18 +503,21 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         else:
             self.resolve_pending_access(target)
 
-    def create_simple_access(self, name: str, lineno: int) -> None:
-        """Create single-component access to scope."""
+    def create_simple_access(
+        self, name: str, lineno: int, prior: Tuple[Component, ...]
+    ) -> None:
+        """Create single-component access to known prior components."""
         component = Component(name, lineno, lineno, 'load')
-        self.create_access(component.name, [component])
+        self.save_access(Access(LinkContext.none, prior, [component]))
 
     def dispatch_result(
         self, result: Union[PendingAccess, Assignment, None]
     ) -> Optional[Access]:
         """Determine the appropriate processing after tracking an access chain."""
-        if isinstance(result, Assignment):
+        result_type = type(result)
+        if result_type is Assignment:
             return self.resolve_assignment(result)
-        elif isinstance(result, PendingAccess):
+        elif result_type is PendingAccess:
             return self.resolve_pending_access(result)
 
     def visit_Global(self, node: ast.Global):
@@ -388,9 +528,10 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         imports = self.outer_scopes_stack[0]
         for name in node.names:
             self.overwrite_name(name)
-            if name in imports:
-                self.assign_name(name, imports[name])
-                self.create_simple_access(name, node.lineno)
+            components = imports.get(name, builtin_components.get(name))
+            if components is not None:
+                self.assign_name(name, components)
+                self.create_simple_access(name, node.lineno, components)
 
     def visit_Nonlocal(self, node: ast.Nonlocal):
         """Import from intermediate scopes."""
@@ -398,22 +539,21 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         for name in node.names:
             self.overwrite_name(name)
             for imports in imports_stack[::-1]:
-                if name in imports:
-                    self.assign_name(name, imports[name])
-                    self.create_simple_access(name, node.lineno)
+                components = imports.get(name, builtin_components.get(name))
+                if components is not None:
+                    self.assign_name(name, components)
+                    self.create_simple_access(name, node.lineno, components)
                     break
 
     def visit_Import(self, node: Union[ast.Import, ast.ImportFrom], prefix: str = ''):
         """Register import source."""
         import_star = (node.names[0].name == '*')
         if import_star:
-            try:
-                mod = import_module(node.module)
-                import_names = [
-                    name for name in mod.__dict__ if not name.startswith('_')
-                ]
+            star_names = _star_import_names(node.module)
+            if star_names is not None:
+                import_names = list(star_names)
                 aliases = [None] * len(import_names)
-            except ImportError:
+            else:
                 logger.warning(
                     f'Could not import module `{node.module}` for parsing!',
                     type=warn_type,
@@ -426,32 +566,36 @@ class ImportTrackerVisitor(ast.NodeVisitor):
             import_names = [name.name for name in node.names]
             aliases = [name.asname for name in node.names]
 
-        prefix_parts = prefix.rstrip('.').split('.') if prefix else []
+        lineno, end_lineno = linenos(node)
+        prefix_parts = prefix[:-1].split('.') if prefix else []
         prefix_components = [
-            Component(n, *linenos(node), 'load') for n in prefix_parts
+            Component(n, lineno, end_lineno, 'load') for n in prefix_parts
         ]
+        prefix_stores = tuple(
+            Component(n, lineno, end_lineno, 'store') for n in prefix_parts
+        )
         if prefix:
-            self.save_access(Access(LinkContext.import_from, [], prefix_components))
+            self.save_access(Access(LinkContext.import_from, (), prefix_components))
 
         for import_name, alias in zip(import_names, aliases):
+            parts = import_name.split('.')
             if not import_star:
                 components = [
-                    Component(n, *linenos(node), 'load')
-                    for n in import_name.split('.')
+                    Component(n, lineno, end_lineno, 'load') for n in parts
                 ]
                 self.save_access(
-                    Access(LinkContext.import_target, [], components, prefix_components)
+                    Access(LinkContext.import_target, (), components, prefix_components)
                 )
 
-            if not alias and '.' in import_name:
+            if not alias and len(parts) > 1:
                 # equivalent to only import top level module since we don't
                 # follow assignments and the outer modules also get imported
-                import_name = import_name.split('.')[0]
+                import_name = parts[0]
+                parts = parts[:1]
 
-            full_components = [
-                Component(n, *linenos(node), 'store')
-                for n in (prefix + import_name).split('.')
-            ]
+            full_components = prefix_stores + tuple(
+                Component(n, lineno, end_lineno, 'store') for n in parts
+            )
             self.assign_name(alias or import_name, full_components)
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
@@ -481,40 +625,38 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         inner: Optional[PendingAccess] = self.visit(node.func)
         if inner is not None:
             inner.components.append(Component.from_ast(node))
-        with self.reset_parents():
-            for arg in node.args + node.keywords:
-                self.visit(arg)
-            if hasattr(node, 'starargs'):
-                self.visit(node.starargs)
-            if hasattr(node, 'kwargs'):
-                self.visit(node.kwargs)
+        self._parents, parents = (0, self._parents)
+        for arg in chain(node.args, node.keywords):
+            self.visit(arg)
+        self._parents = parents
         return inner
 
     @track_parents
     def visit_Tuple(self, node: ast.Tuple):
         """Visit a Tuple node."""
-        if isinstance(node.ctx, ast.Store):
+        if type(node.ctx) is ast.Store:
             accesses = []
             for element in node.elts:
                 ret = self.visit(element)
-                if isinstance(ret, PendingAccess) or ret is None:
+                if ret is None or type(ret) is PendingAccess:
                     accesses.append(ret)
                 else:
                     accesses.extend(ret)
             return accesses
         else:
-            with self.reset_parents():
-                for element in node.elts:
-                    self.visit(element)
+            self._parents, parents = (0, self._parents)
+            for element in node.elts:
+                self.visit(element)
+            self._parents = parents
 
     @track_parents
     def visit_Assign(self, node: ast.Assign):
         """Visit an Assign node."""
         value = self.visit(node.value)
         targets = []
-        for n in node.targets[::-1]:
+        for n in reversed(node.targets):
             target = self.visit(n)
-            if not isinstance(target, list):
+            if type(target) is not list:
                 target = [target]
             targets.append(AssignTarget(target))
         return Assignment(targets, value)
@@ -554,8 +696,9 @@ class ImportTrackerVisitor(ast.NodeVisitor):
     @track_parents
     def visit_MatchClass(self, node):
         """Visit a match case class as a series of assignments."""
-        with self.reset_parents():
-            cls = self.visit(node.cls)
+        self._parents, parents = (0, self._parents)
+        cls = self.visit(node.cls)
+        self._parents = parents
 
         accesses = []
         for n in node.patterns:
@@ -619,35 +762,37 @@ class ImportTrackerVisitor(ast.NodeVisitor):
 
     @staticmethod
     def _get_args(node: ast.arguments):
-        posonly = getattr(node, 'posonlyargs', [])  # only on 3.8+
-        return node.args + node.kwonlyargs + posonly
+        posonly = getattr(node, 'posonlyargs', ())  # only on 3.8+
+        return chain(
+            node.args, node.kwonlyargs, posonly, (node.vararg, node.kwarg)
+        )
 
     def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]):
         """Swap node order and separate inner scope."""
         self.overwrite_name(node.name)
         for dec in node.decorator_list:
             self.visit(dec)
-        for d in node.args.defaults + node.args.kw_defaults:
+        for d in chain(node.args.defaults, node.args.kw_defaults):
             if d is None:
                 continue
             self.visit(d)
         args = self._get_args(node.args)
-        args += [node.args.vararg, node.args.kwarg]
 
-        inner = self.__class__(self.doctree_node)
-        inner.pseudo_scopes_stack[0] = self.pseudo_scopes_stack[0].copy()
+        inner = self.__class__(
+            self.doctree_node, scope=self.pseudo_scopes_stack[0].copy()
+        )
         inner.outer_scopes_stack = list(self.outer_scopes_stack)
         inner.outer_scopes_stack.append(self.pseudo_scopes_stack[0])
+        inner.accessed = self.accessed
 
+        if node.returns is not None:
+            self.visit(node.returns)
         for arg in args:
             if arg is None:
                 continue
             inner.visit(arg)
-        if node.returns is not None:
-            self.visit(node.returns)
         for n in node.body:
             inner.visit(n)
-        self.accessed.extend(inner.accessed)
 
     @track_parents
     def visit_arg(self, arg: ast.arg):
@@ -665,21 +810,21 @@ class ImportTrackerVisitor(ast.NodeVisitor):
 
     def visit_Lambda(self, node: ast.Lambda):
         """Swap node order and separate inner scope."""
-        for d in node.args.defaults + node.args.kw_defaults:
+        for d in chain(node.args.defaults, node.args.kw_defaults):
             if d is None:
                 continue
             self.visit(d)
         args = self._get_args(node.args)
-        args += [node.args.vararg, node.args.kwarg]
 
-        inner = self.__class__(self.doctree_node)
-        inner.pseudo_scopes_stack[0] = self.pseudo_scopes_stack[0].copy()
+        inner = self.__class__(
+            self.doctree_node, scope=self.pseudo_scopes_stack[0].copy()
+        )
+        inner.accessed = self.accessed
         for arg in args:
             if arg is None:
                 continue
             inner.overwrite_name(arg.arg)
         inner.visit(node.body)
-        self.accessed.extend(inner.accessed)
 
     def visit_ListComp(self, node: ast.ListComp):
         """Delegate to generic comp."""
@@ -708,10 +853,17 @@ class ImportTrackerVisitor(ast.NodeVisitor):
         self, values: List[ast.AST], generators: List[ast.comprehension]
     ):
         """Separate inner scope, respects class body scope."""
-        inner = self.__class__(self.doctree_node)
-        inner.pseudo_scopes_stack[0] = self.pseudo_scopes_stack[-1].copy()
+        # Visit in place with a temporary stack, since comprehensions
+        # only contain expressions and can't leak names to the outer scope
+        stack = self.pseudo_scopes_stack
+        self.pseudo_scopes_stack = [stack[-1].copy()]
+        self.in_augassign, in_augassign = (False, self.in_augassign)
         for gen in generators:
-            inner.visit(gen)
+            self.visit(gen)
         for value in values:
-            inner.visit(value)
-        self.accessed.extend(inner.accessed)
+            self.visit(value)
+        self.pseudo_scopes_stack = stack
+        self.in_augassign = in_augassign
+
+
+ImportTrackerVisitor._build_dispatch()
@@ -1,5 +1,6 @@
+import ast
 import pytest
-from sphinx_codeautolink.parse import Component
+from sphinx_codeautolink.parse import Component, ImportTrackerVisitor
 from ._util import refs_equal
 
 
@@ -8,6 +9,9 @@ class TestUnit:
         with pytest.raises(ValueError):
             Component.from_ast('not ast')
 
+    def test_dispatch_skips_inherited_visitors(self):
+        assert ast.Constant not in ImportTrackerVisitor._dispatch
+
 
 class TestSimple:
     @refs_equal
@@ -154,3 +158,9 @@ class TestSimple:
             ('sphinx_codeautolink.setup', 'setup')
         ]
         return s, refs
+
+    @refs_equal
+    def test_import_star_respects_all(self):
+        s = 'from posixpath import *\njoin\nsys'
+        refs = [('posixpath', 'posixpath'), ('posixpath.join', 'join')]
+        return s, refs